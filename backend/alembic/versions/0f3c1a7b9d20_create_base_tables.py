@@ -0,0 +1,95 @@
+"""create_base_tables
+
+Revision ID: 0f3c1a7b9d20
+Revises:
+Create Date: 2026-10-16 09:12:40.381952
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f3c1a7b9d20'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases that predate Alembic already have these tables from create_all();
+    # only an empty database is bootstrapped here. The tables match the schema the
+    # next revisions expect (no search_queries.user_id, no extra company fields yet).
+    inspector = sa.inspect(op.get_bind())
+    if 'users' in inspector.get_table_names():
+        return
+
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    op.create_table(
+        'search_queries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('city', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_search_queries_id', 'search_queries', ['id'])
+    op.create_index('ix_search_queries_city', 'search_queries', ['city'])
+    op.create_index('ix_search_queries_category', 'search_queries', ['category'])
+
+    op.create_table(
+        'places',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('place_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('address', sa.String(), nullable=True),
+        sa.Column('city', sa.String(), nullable=True),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('latitude', sa.Float(), nullable=True),
+        sa.Column('longitude', sa.Float(), nullable=True),
+        sa.Column('rating', sa.Float(), nullable=True),
+        sa.Column('user_ratings_total', sa.Integer(), nullable=True),
+        sa.Column('phone_number', sa.String(), nullable=True),
+        sa.Column('website', sa.String(), nullable=True),
+        sa.Column('business_status', sa.String(), nullable=True),
+        sa.Column('types', sa.Text(), nullable=True),
+        sa.Column('formatted_address', sa.String(), nullable=True),
+        sa.Column('international_phone_number', sa.String(), nullable=True),
+        sa.Column('opening_hours', sa.Text(), nullable=True),
+        sa.Column('price_level', sa.Integer(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('photo_reference', sa.String(), nullable=True),
+        sa.Column('photo_url', sa.String(), nullable=True),
+        sa.Column('has_details', sa.Boolean(), nullable=True),
+        sa.Column('search_query_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['search_query_id'], ['search_queries.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_places_id', 'places', ['id'])
+    op.create_index('ix_places_place_id', 'places', ['place_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('places')
+    op.drop_table('search_queries')
+    op.drop_table('users')
@@ -0,0 +1,88 @@
+"""unique_search_query_per_user
+
+Revision ID: 3f9d2b7e1a64
+Revises: c65ea952406e
+Create Date: 2026-10-15 10:04:19.527731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9d2b7e1a64'
+down_revision: Union[str, Sequence[str], None] = 'c65ea952406e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Searches are now looked up trimmed and lowercased (SearchRequest normalizes
+    # them), so bring stored rows into the same form first
+    op.execute(
+        "UPDATE search_queries SET city = LOWER(TRIM(city)), category = LOWER(TRIM(category)) "
+        "WHERE city <> LOWER(TRIM(city)) OR category <> LOWER(TRIM(category))"
+    )
+    
+    # Collapse duplicate (city, category, user_id) rows onto the oldest one (MIN(id)):
+    # re-point their places at it, then delete the duplicates so the constraint
+    # below can be created
+    op.execute(
+        "UPDATE places SET search_query_id = ("
+        "  SELECT MIN(keep.id) FROM search_queries keep, search_queries dup"
+        "  WHERE dup.id = places.search_query_id"
+        "  AND keep.city = dup.city AND keep.category = dup.category AND keep.user_id = dup.user_id"
+        ") WHERE search_query_id IN ("
+        "  SELECT dup.id FROM search_queries dup WHERE EXISTS ("
+        "    SELECT 1 FROM search_queries keep"
+        "    WHERE keep.city = dup.city AND keep.category = dup.category"
+        "    AND keep.user_id = dup.user_id AND keep.id < dup.id"
+        "  )"
+        ")"
+    )
+    op.execute(
+        "DELETE FROM search_queries WHERE EXISTS ("
+        "  SELECT 1 FROM search_queries keep"
+        "  WHERE keep.city = search_queries.city AND keep.category = search_queries.category"
+        "  AND keep.user_id = search_queries.user_id AND keep.id < search_queries.id"
+        ")"
+    )
+    
+    # The composite unique index serves (city, category, user_id) lookups with a
+    # single B-tree probe, making the single-column city/category indexes redundant
+    # Each step is skipped if the database (e.g. one built by create_all()) is already there
+    inspector = sa.inspect(op.get_bind())
+    constraints = {uc['name'] for uc in inspector.get_unique_constraints('search_queries')}
+    indexes = {index['name'] for index in inspector.get_indexes('search_queries')}
+    with op.batch_alter_table('search_queries') as batch_op:
+        if 'uq_search_queries_city_category_user' not in constraints:
+            batch_op.create_unique_constraint(
+                'uq_search_queries_city_category_user',
+                ['city', 'category', 'user_id']
+            )
+        if 'ix_search_queries_city' in indexes:
+            batch_op.drop_index('ix_search_queries_city')
+        if 'ix_search_queries_category' in indexes:
+            batch_op.drop_index('ix_search_queries_category')
+    
+    # SQLite's batch recreate (here or in da8a216bb298) rebuilds indexes from
+    # reflection, which loses the DESC on created_at; rebuild it as models.py declares it
+    if op.get_bind().dialect.name == 'sqlite':
+        if any(index['name'] == 'ix_search_queries_user_created' for index in sa.inspect(op.get_bind()).get_indexes('search_queries')):
+            op.drop_index('ix_search_queries_user_created', table_name='search_queries')
+        op.create_index(
+            'ix_search_queries_user_created',
+            'search_queries',
+            ['user_id', sa.text('created_at DESC')]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('search_queries') as batch_op:
+        batch_op.create_index('ix_search_queries_category', ['category'])
+        batch_op.create_index('ix_search_queries_city', ['city'])
+        batch_op.drop_constraint('uq_search_queries_city_category_user', type_='unique')
@@ -20,14 +20,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('places', sa.Column('email', sa.String(), nullable=True))
-    op.add_column('places', sa.Column('owner', sa.String(), nullable=True))
-    op.add_column('places', sa.Column('postal_code', sa.String(), nullable=True))
-    op.add_column('places', sa.Column('province', sa.String(), nullable=True))
-    op.add_column('places', sa.Column('suburb', sa.String(), nullable=True))
-    op.add_column('places', sa.Column('service_type', sa.String(), nullable=True))
-    # ### end Alembic commands ###
+    # Databases created with create_all() may already have these columns
+    inspector = sa.inspect(op.get_bind())
+    existing = {col['name'] for col in inspector.get_columns('places')}
+    for name in ('email', 'owner', 'postal_code', 'province', 'suburb', 'service_type'):
+        if name not in existing:
+            op.add_column('places', sa.Column(name, sa.String(), nullable=True))
 
 
 def downgrade() -> None:
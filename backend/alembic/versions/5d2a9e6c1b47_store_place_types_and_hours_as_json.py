@@ -0,0 +1,49 @@
+"""store_place_types_and_hours_as_json
+
+Revision ID: 5d2a9e6c1b47
+Revises: 8b1e4c0d7f52
+Create Date: 2026-10-15 21:40:12.518337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a9e6c1b47'
+down_revision: Union[str, Sequence[str], None] = '8b1e4c0d7f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no JSON storage type: the existing TEXT values are already JSON
+    # documents, which SQLAlchemy's JSON type reads as-is.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in ('types', 'opening_hours'):
+        op.alter_column(
+            'places',
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in ('types', 'opening_hours'):
+        op.alter_column(
+            'places',
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::text',
+        )
@@ -0,0 +1,42 @@
+"""add_places_pending_details_indexes
+
+Revision ID: 8b1e4c0d7f52
+Revises: 3f9d2b7e1a64
+Create Date: 2026-10-15 10:41:07.803415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e4c0d7f52'
+down_revision: Union[str, Sequence[str], None] = '3f9d2b7e1a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Skip indexes create_all() already built
+    inspector = sa.inspect(op.get_bind())
+    existing = {index['name'] for index in inspector.get_indexes('places')}
+    if 'ix_places_sqid' not in existing:
+        op.create_index('ix_places_sqid', 'places', ['search_query_id'])
+    # Partial index so the pending-details lookup only touches rows still missing details
+    if 'ix_places_pending' not in existing:
+        op.create_index(
+            'ix_places_pending',
+            'places',
+            ['search_query_id'],
+            postgresql_where=sa.text('has_details = false'),
+            sqlite_where=sa.text('has_details = 0'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_places_pending', table_name='places')
+    op.drop_index('ix_places_sqid', table_name='places')
@@ -0,0 +1,48 @@
+"""drop_redundant_indexes
+
+Revision ID: 9c4f7a2d3e18
+Revises: 5d2a9e6c1b47
+Create Date: 2026-10-15 21:46:33.104728
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f7a2d3e18'
+down_revision: Union[str, Sequence[str], None] = '5d2a9e6c1b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index=True on the primary keys created a second B-tree next to the PK's own, and
+# ix_search_queries_user_created already serves user_id lookups as its leading column
+REDUNDANT_INDEXES = (
+    ('ix_places_id', 'places', ['id']),
+    ('ix_search_queries_id', 'search_queries', ['id']),
+    ('ix_users_id', 'users', ['id']),
+    ('ix_search_queries_user_id', 'search_queries', ['user_id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table_name, _ in REDUNDANT_INDEXES:
+        # Skip indexes this database never had
+        if any(index['name'] == index_name for index in inspector.get_indexes(table_name)):
+            op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table_name, columns in REDUNDANT_INDEXES:
+        # Mirror upgrade(): only recreate indexes that are missing and whose columns exist
+        existing_columns = {column['name'] for column in inspector.get_columns(table_name)}
+        if any(index['name'] == index_name for index in inspector.get_indexes(table_name)):
+            continue
+        if set(columns) <= existing_columns:
+            op.create_index(index_name, table_name, columns)
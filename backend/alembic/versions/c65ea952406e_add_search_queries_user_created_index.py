@@ -0,0 +1,37 @@
+"""add_search_queries_user_created_index
+
+Revision ID: c65ea952406e
+Revises: 474b46845531
+Create Date: 2026-10-15 09:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c65ea952406e'
+down_revision: Union[str, Sequence[str], None] = '474b46845531'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves "WHERE user_id = ? ORDER BY created_at DESC" without a separate sort.
+    # Skipped if create_all() already built it
+    inspector = sa.inspect(op.get_bind())
+    if any(index['name'] == 'ix_search_queries_user_created' for index in inspector.get_indexes('search_queries')):
+        return
+    op.create_index(
+        'ix_search_queries_user_created',
+        'search_queries',
+        ['user_id', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_search_queries_user_created', table_name='search_queries')
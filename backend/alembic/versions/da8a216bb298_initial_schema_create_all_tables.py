@@ -1,7 +1,7 @@
 """Initial schema - create all tables
 
 Revision ID: da8a216bb298
-Revises: 
+Revises: 0f3c1a7b9d20
 Create Date: 2025-11-30 14:03:02.639314
 
 """
@@ -14,10 +14,12 @@ from sqlalchemy import text
 
 # revision identifiers, used by Alembic.
 revision: str = 'da8a216bb298'
-down_revision: Union[str, Sequence[str], None] = None
+down_revision: Union[str, Sequence[str], None] = '0f3c1a7b9d20'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+USER_ID_BACKFILL_BATCH_SIZE = 10000
+
 
 def upgrade() -> None:
     """Upgrade schema."""
@@ -33,42 +35,63 @@ def upgrade() -> None:
         # Add column as nullable first (for existing databases with data)
         op.add_column('search_queries', sa.Column('user_id', sa.Integer(), nullable=True))
         
-        # Data migration: Assign existing queries to the first user
-        result = connection.execute(text("SELECT id FROM users ORDER BY id LIMIT 1"))
-        first_user = result.fetchone()
-        
-        if first_user:
-            user_id = first_user[0]
-            connection.execute(
-                text("UPDATE search_queries SET user_id = :user_id WHERE user_id IS NULL"),
-                {"user_id": user_id}
-            )
-            connection.commit()
+    # Data migration: Assign existing queries to the first user. Runs whenever rows
+    # are still NULL so a run interrupted mid-backfill picks up where it stopped
+    # Fail early with a clear message rather than at the NOT NULL alter below
+    user_count = connection.execute(text("SELECT COUNT(*) FROM users")).scalar()
+    pending_count = connection.execute(text("SELECT COUNT(*) FROM search_queries WHERE user_id IS NULL")).scalar()
+    if user_count == 0 and pending_count > 0:
+        raise RuntimeError(
+            "Cannot assign existing search_queries to a user: the users table is empty. "
+            "Create a user first, then re-run the migration."
+        )
     
-    # Make column non-nullable and add foreign key
-    op.alter_column('search_queries', 'user_id',
-               existing_type=sa.INTEGER(),
-               nullable=False)
-    op.create_foreign_key('fk_search_queries_user_id', 'search_queries', 'users', ['user_id'], ['id'])
+    # Resolve the owner server-side and update in bounded batches so large
+    # tables don't produce one giant write. The autocommit block commits any
+    # pending DDL first and then each batch on its own, so locks and undo are
+    # bounded per batch rather than held for the whole table.
+    with op.get_context().autocommit_block():
+        while True:
+            result = connection.execute(text(
+                "UPDATE search_queries SET user_id = (SELECT MIN(id) FROM users) "
+                "WHERE id IN (SELECT id FROM search_queries WHERE user_id IS NULL LIMIT :batch_size)"
+            ), {"batch_size": USER_ID_BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+
+    # Make column non-nullable and add foreign key (batch mode so SQLite can
+    # apply both by recreating the table)
+    has_user_fk = any(
+        fk['constrained_columns'] == ['user_id']
+        for fk in sa.inspect(connection).get_foreign_keys('search_queries')
+    )
+    with op.batch_alter_table('search_queries') as batch_op:
+        batch_op.alter_column('user_id',
+                   existing_type=sa.INTEGER(),
+                   nullable=False)
+        if not has_user_fk:
+            batch_op.create_foreign_key('fk_search_queries_user_id', 'users', ['user_id'], ['id'])
     
-    # Create index if it doesn't exist
-    try:
+    # Create index if it doesn't exist. Checked up front rather than caught, since a
+    # failed statement aborts the whole transaction on PostgreSQL
+    indexes = {index['name'] for index in sa.inspect(connection).get_indexes('search_queries')}
+    if 'ix_search_queries_user_id' not in indexes:
         op.create_index('ix_search_queries_user_id', 'search_queries', ['user_id'])
-    except Exception:
-        # Index might already exist
-        pass
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Remove foreign key and index
-    op.drop_constraint('fk_search_queries_user_id', 'search_queries', type_='foreignkey')
-    try:
+    inspector = sa.inspect(op.get_bind())
+    foreign_keys = inspector.get_foreign_keys('search_queries')
+    indexes = {index['name'] for index in inspector.get_indexes('search_queries')}
+    if 'ix_search_queries_user_id' in indexes:
         op.drop_index('ix_search_queries_user_id', table_name='search_queries')
-    except Exception:
-        pass
     
     # Make column nullable (but don't remove it to preserve data)
-    op.alter_column('search_queries', 'user_id',
-               existing_type=sa.INTEGER(),
-               nullable=True)
+    with op.batch_alter_table('search_queries') as batch_op:
+        if any(fk['name'] == 'fk_search_queries_user_id' for fk in foreign_keys):
+            batch_op.drop_constraint('fk_search_queries_user_id', type_='foreignkey')
+        batch_op.alter_column('user_id',
+                   existing_type=sa.INTEGER(),
+                   nullable=True)
@@ -1,14 +1,22 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from datetime import timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from cachetools import TLRUCache, TTLCache
 from .database import get_db
 from .models import User
 from .logging_config import get_logger
+import asyncio
+import hmac
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -22,70 +30,178 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 if SECRET_KEY == "your-secret-key-change-in-production":
     logger.warning("Using default SECRET_KEY - this should be changed in production!")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use Argon2id (memory-hard, OWASP-recommended parameters). Existing
+# bcrypt hashes still verify and are transparently rehashed on the next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    deprecated=["bcrypt"],
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+
+# Resolve hash backends once at import. passlib otherwise does this lazily on the
+# first hash/verify, including bcrypt's backend self-test, inside a request.
+for _scheme in pwd_context.schemes():
+    pwd_context.handler(_scheme).get_backend()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# Short-lived cache of password verify decisions so repeat logins skip the KDF.
+# Keys are HMAC(SECRET_KEY, plain|hashed) so no plaintext is kept in memory, and
+# only the (plain, hashed) -> bool decision is cached: a changed or deleted hash
+# never matches a stale entry.
+_VERIFY_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_VERIFY_CACHE_LOCK = threading.Lock()
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    return hmac.new(
+        SECRET_KEY.encode(),
+        plain_password.encode() + b"|" + hashed_password.encode(),
+        "sha256"
+    ).digest()
+
+# Password hashing is CPU-bound; async callers hand it to worker processes so the
+# event loop stays responsive and concurrent logins spread across cores. Workers are
+# started from a forkserver rather than forked from the (threaded) server process,
+# and each one holds argon2's memory cost per hash, so the pool size is capped.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(os.cpu_count() or 1, 4))))
+_HASH_POOL = ProcessPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS,
+    mp_context=multiprocessing.get_context("forkserver"),
+)
+
+def shutdown_hash_pool() -> None:
+    _HASH_POOL.shutdown(wait=True, cancel_futures=True)
+
+def _verify_cache_get(key: bytes) -> Optional[bool]:
+    with _VERIFY_CACHE_LOCK:
+        return _VERIFY_CACHE.get(key)
+
+def _verify_cache_set(key: bytes, result: bool) -> None:
+    with _VERIFY_CACHE_LOCK:
+        _VERIFY_CACHE[key] = result
+
+def _pwd_verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    key = _verify_cache_key(plain_password, hashed_password)
+    cached = _verify_cache_get(key)
+    if cached is not None:
+        return cached
+    result = _pwd_verify(plain_password, hashed_password)
+    _verify_cache_set(key, result)
+    return result
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Async variant of verify_password that runs the check in the process pool.
+    """
+    key = _verify_cache_key(plain_password, hashed_password)
+    cached = _verify_cache_get(key)
+    if cached is not None:
+        return cached
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(_HASH_POOL, _pwd_verify, plain_password, hashed_password)
+    _verify_cache_set(key, result)
+    return result
+
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
-    Raises ValueError if password is longer than 72 bytes.
+    Hash a password using the default scheme (Argon2id).
     """
-    # Check byte length before hashing (bcrypt limit is 72 bytes)
-    password_bytes = password.encode('utf-8')
-    password_byte_len = len(password_bytes)
-    
-    if password_byte_len > 72:
-        raise ValueError(f"Password cannot be longer than 72 bytes (got {password_byte_len} bytes)")
-    
-    # Hash the password
-    # Note: Some bcrypt/passlib versions have a bug where they throw false positive
-    # 72-byte errors even for valid passwords. We've already validated the length.
-    try:
-        return pwd_context.hash(password)
-    except ValueError as e:
-        error_msg = str(e).lower()
-        # Check if this is a false positive 72-byte error from bcrypt
-        if ("72 bytes" in error_msg or "longer than 72" in error_msg or "truncate" in error_msg) and password_byte_len <= 72:
-            # This is a known false positive bug in some bcrypt/passlib versions
-            # Since we've validated the password is <= 72 bytes, we can safely proceed
-            # by using bcrypt directly instead of through passlib
-            logger.warning(f"Bcrypt false positive error detected for {password_byte_len} byte password. Using direct bcrypt hash.")
-            import bcrypt
-            # Hash directly with bcrypt (password_bytes is already validated to be <= 72)
-            salt = bcrypt.gensalt()
-            hashed = bcrypt.hashpw(password_bytes, salt)
-            # Return as string (passlib format)
-            return hashed.decode('utf-8')
-        # Re-raise if it's a different error
-        raise
+    return pwd_context.hash(password)
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Async variant of get_password_hash that hashes in the process pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, get_password_hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+    # Integer epoch seconds: jose accepts these directly for "exp"
+    lifetime = int((expires_delta or timedelta(minutes=15)).total_seconds())
+    to_encode["exp"] = int(time.time()) + lifetime
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# Decoded JWT payloads keyed by token string. Entries expire after 15s or at the
+# token's own `exp`, whichever comes first, so an expired token is never served.
+_JWT_CACHE_TTL = 15
+_JWT_CACHE: TLRUCache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _token, payload, now: min(now + _JWT_CACHE_TTL, payload.get("exp", now)),
+    timer=time.time,
+)
+_JWT_CACHE_LOCK = threading.Lock()
+
+# Loaded users keyed by username, detached from their session, so back-to-back
+# authenticated requests skip the user SELECT. Within a single request FastAPI
+# already resolves get_current_user once and shares it across dependants.
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "30"))
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+_USER_CACHE_LOCK = threading.Lock()
+
+def _decode_token(token: str) -> dict:
+    with _JWT_CACHE_LOCK:
+        payload = _JWT_CACHE.get(token)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with _JWT_CACHE_LOCK:
+            _JWT_CACHE[token] = payload
+    return payload
+
+def _user_cache_get(username: str) -> Optional[User]:
+    with _USER_CACHE_LOCK:
+        return _USER_CACHE.get(username)
+
+def _load_user(db: Session, username: str) -> Optional[User]:
+    user = get_user_by_username(db, username=username)
+    if user is not None:
+        # Detach so commits in this request's session don't expire the shared copy
+        db.expunge(user)
+        with _USER_CACHE_LOCK:
+            _USER_CACHE[username] = user
+    return user
+
+def invalidate_user_cache(username: str) -> None:
+    """
+    Drop a cached user so the next request reloads it (call after changing the row).
+    """
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop(username, None)
+
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
     return db.query(User).filter(User.username == username).first()
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    user = get_user_by_email(db, email)
+def _save_rehashed_password(db: Session, user: User, hashed_password: str) -> None:
+    user.hashed_password = hashed_password
+    db.commit()
+    # Reload now so callers can read the expired attributes without blocking
+    db.refresh(user)
+
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+    # The Session is synchronous, so its queries run in the threadpool rather than
+    # on the event loop
+    user = await run_in_threadpool(get_user_by_email, db, email)
     if not user:
         logger.debug(f"Authentication failed: user '{email}' not found")
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await averify_password(password, user.hashed_password):
         logger.debug(f"Authentication failed: invalid password for user '{email}'")
         return None
+    if pwd_context.needs_update(user.hashed_password):
+        # Upgrade hashes created with an outdated cost/scheme now that we know the plaintext
+        logger.info(f"Rehashing password for user '{email}' with current hash settings")
+        hashed_password = await aget_password_hash(password)
+        await run_in_threadpool(_save_rehashed_password, db, user, hashed_password)
+        invalidate_user_cache(user.username)
     logger.debug(f"Authentication successful for user '{email}'")
     return user
 
@@ -99,7 +215,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             logger.warning("JWT token missing 'sub' claim")
@@ -107,7 +223,9 @@ async def get_current_user(
     except JWTError as e:
         logger.warning(f"JWT validation failed: {str(e)}")
         raise credentials_exception
-    user = get_user_by_username(db, username=username)
+    user = _user_cache_get(username)
+    if user is None:
+        user = await run_in_threadpool(_load_user, db, username)
     if user is None:
         logger.warning(f"User '{username}' from JWT token not found in database")
         raise credentials_exception
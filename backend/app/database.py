@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 import os
 from dotenv import load_dotenv
 
@@ -10,6 +11,9 @@ load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 DB_TYPE = os.getenv("DB_TYPE")
 
+# Compiled-statement cache entries per engine (SQLAlchemy default is 500)
+QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
 # Auto-detect database type from DATABASE_URL if not explicitly set
 if not DB_TYPE:
     if DATABASE_URL and DATABASE_URL.startswith("postgresql://"):
@@ -20,12 +24,43 @@ if not DB_TYPE:
 if DB_TYPE == "postgres":
     if not DATABASE_URL:
         raise ValueError("DATABASE_URL must be set when using PostgreSQL")
-    engine = create_engine(DATABASE_URL)
+    # LIFO keeps the most recently used connections warm; pre_ping/recycle avoid
+    # handing out connections the server (or a proxy) has already dropped.
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
 else:
     # SQLite
     if not DATABASE_URL:
         DATABASE_URL = "sqlite:///./company_info.db"
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    if ":memory:" in DATABASE_URL or DATABASE_URL in ("sqlite://", "sqlite:///"):
+        # In-memory databases only exist per connection, so share a single one
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            query_cache_size=QUERY_CACHE_SIZE,
+        )
+    else:
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            query_cache_size=QUERY_CACHE_SIZE,
+        )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers proceed during writes; NORMAL sync is safe under WAL
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
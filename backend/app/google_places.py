@@ -1,6 +1,9 @@
-import requests
-import json
-from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import httpx
+import orjson
+import redis.asyncio as redis
+from typing import Any, FrozenSet, List, Dict, Optional, Union
 import os
 from dotenv import load_dotenv
 from .logging_config import get_logger
@@ -11,11 +14,31 @@ logger = get_logger(__name__)
 
 GOOGLE_PLACES_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 GOOGLE_PLACES_API_BASE_URL = "https://maps.googleapis.com/maps/api/place"
+# Place Details field mask: only what format_place_details reads (billing and latency scale with fields)
+PLACE_DETAILS_FIELDS = ",".join([
+    "formatted_address",
+    "address_components",
+    "geometry",
+    "rating",
+    "user_ratings_total",
+    "formatted_phone_number",
+    "international_phone_number",
+    "website",
+    "business_status",
+    "types",
+    "opening_hours",
+    "price_level",
+    "editorial_summary",
+    "photos",
+])
+# Part of the details cache key, so changing the field mask never serves entries
+# cached with the old one
+_DETAILS_FIELDS_KEY = hashlib.sha1(PLACE_DETAILS_FIELDS.encode()).hexdigest()[:8]
 
-# Optional allowlist for Google API calls
+# Optional allowlist for Google API calls, parsed once into an immutable set of lowercase emails
 _allow_emails_env = os.getenv("ALLOW_EMAILS")
-ALLOWED_GOOGLE_API_EMAILS = (
-    {email.strip().lower() for email in _allow_emails_env.split(",") if email.strip()}
+ALLOWED_GOOGLE_API_EMAILS: Optional[FrozenSet[str]] = (
+    frozenset(email.strip().lower() for email in _allow_emails_env.split(",") if email.strip())
     if _allow_emails_env
     else None
 )
@@ -29,6 +52,40 @@ if ALLOWED_GOOGLE_API_EMAILS is not None:
 else:
     logger.info("Google Places API access allowed for all authenticated users (ALLOW_EMAILS not set)")
 
+# Shared async client: pooled keep-alive connections, and HTTP/2 lets concurrent
+# requests to the same host multiplex over a single connection. The transport's
+# retries only cover connection failures; _get_with_retry handles 429/5xx.
+# Closed on application shutdown via close_client().
+_ASYNC_CLIENT = httpx.AsyncClient(
+    timeout=10,
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+)
+
+# Optional Redis cache for Google responses (disabled when REDIS_URL is unset).
+# Text search results change slowly and place details are nearly immutable, so
+# caching them saves both latency and paid API calls.
+REDIS_URL = os.getenv("REDIS_URL")
+TEXT_SEARCH_CACHE_TTL = int(os.getenv("TEXT_SEARCH_CACHE_TTL", str(24 * 60 * 60)))
+DETAILS_CACHE_TTL = int(os.getenv("DETAILS_CACHE_TTL", str(7 * 24 * 60 * 60)))
+_REDIS = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+
+if _REDIS is not None:
+    logger.info("Google Places response caching enabled via REDIS_URL")
+
+# Max concurrent Place Details requests issued by get_place_details_bulk.
+# Lower it if the API key's per-second quota starts returning OVER_QUERY_LIMIT.
+DETAILS_MAX_CONCURRENCY = max(1, int(os.getenv("GOOGLE_DETAILS_MAX_CONCURRENCY", "10")))
+
+# Status-based retry for Google calls: up to RETRY_TOTAL retries with exponential
+# backoff (0.2s, 0.4s, 0.8s), honouring Retry-After when the API sends one
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 logger.info("Google Places API module initialized")
 
 def _extract_address_component(components: list, desired_types: list) -> Optional[str]:
@@ -50,9 +107,62 @@ def is_google_access_allowed(user_email: str) -> bool:
         return True
     return user_email.lower() in ALLOWED_GOOGLE_API_EMAILS
 
-def text_search(query: str, location: Optional[str] = None) -> Dict:
+async def close_client() -> None:
+    """
+    Close the shared HTTP client and Redis connections.
+    """
+    await _ASYNC_CLIENT.aclose()
+    if _REDIS is not None:
+        await _REDIS.aclose()
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+async def _get_with_retry(url: str, params: Dict) -> httpx.Response:
+    """
+    GET url on the shared client, retrying 429 and 5xx responses with backoff.
+    The last response is returned as-is once retries run out.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        response = await _ASYNC_CLIENT.get(url, params=params)
+        if response.status_code not in RETRY_STATUS_CODES or attempt == RETRY_TOTAL:
+            return response
+        delay = _retry_delay(response, attempt)
+        logger.warning(f"Google Places API returned HTTP {response.status_code}, retrying in {delay:.1f}s (attempt {attempt + 1}/{RETRY_TOTAL})")
+        await asyncio.sleep(delay)
+    return response
+
+async def _cache_get(key: str) -> Optional[Any]:
+    """
+    Return the cached value for key, or None on a miss or if caching is unavailable.
+    """
+    if _REDIS is None:
+        return None
+    try:
+        value = await _REDIS.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Redis GET failed for key '{key}': {str(e)}")
+        return None
+    return orjson.loads(value) if value is not None else None
+
+async def _cache_set(key: str, ttl: int, data: Any) -> None:
+    """
+    Store data under key for ttl seconds. Cache errors are logged, never raised.
+    """
+    if _REDIS is None:
+        return
+    try:
+        await _REDIS.setex(key, ttl, orjson.dumps(data))
+    except redis.RedisError as e:
+        logger.warning(f"Redis SETEX failed for key '{key}': {str(e)}")
+
+async def text_search(query: str, location: Optional[str] = None, use_cache: bool = True) -> Dict:
     """
     Perform Google Places Text Search
+    With use_cache=False the cached response is skipped, but a fresh result is still stored.
     """
     url = f"{GOOGLE_PLACES_API_BASE_URL}/textsearch/json"
     params = {
@@ -63,9 +173,15 @@ def text_search(query: str, location: Optional[str] = None) -> Dict:
     if location:
         params["location"] = location
     
+    cache_key = "gp:ts:" + hashlib.sha1(f"{query}|{location or ''}".encode()).hexdigest()
+    cached = await _cache_get(cache_key) if use_cache else None
+    if cached is not None:
+        logger.info(f"Google Places Text Search cache hit: query='{query}', location={location}")
+        return cached
+    
     logger.info(f"Calling Google Places Text Search API: query='{query}', location={location}")
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = await _get_with_retry(url, params)
         response.raise_for_status()
         data = response.json()
         status = data.get("status", "UNKNOWN")
@@ -74,26 +190,35 @@ def text_search(query: str, location: Optional[str] = None) -> Dict:
         
         if status != "OK":
             logger.warning(f"Google Places API returned non-OK status: {status}")
+        else:
+            await _cache_set(cache_key, TEXT_SEARCH_CACHE_TTL, data)
         
         return data
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error calling Google Places Text Search API: {str(e)}", exc_info=True)
         raise
 
-def get_place_details(place_id: str) -> Dict:
+async def get_place_details(place_id: str, use_cache: bool = True) -> Dict:
     """
     Get detailed information about a place using Place Details API
+    With use_cache=False the cached response is skipped, but a fresh result is still stored.
     """
     url = f"{GOOGLE_PLACES_API_BASE_URL}/details/json"
     params = {
         "place_id": place_id,
-        "fields": "name,formatted_address,address_components,geometry,rating,user_ratings_total,formatted_phone_number,international_phone_number,website,business_status,types,opening_hours,price_level,editorial_summary,photos",
+        "fields": PLACE_DETAILS_FIELDS,
         "key": GOOGLE_PLACES_API_KEY
     }
     
+    cache_key = f"gp:details:{_DETAILS_FIELDS_KEY}:{place_id}"
+    cached = await _cache_get(cache_key) if use_cache else None
+    if cached is not None:
+        logger.debug(f"Google Places Details cache hit for place_id: {place_id}")
+        return cached
+    
     logger.debug(f"Calling Google Places Details API for place_id: {place_id}")
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = await _get_with_retry(url, params)
         response.raise_for_status()
         data = response.json()
         status = data.get("status", "UNKNOWN")
@@ -101,13 +226,32 @@ def get_place_details(place_id: str) -> Dict:
         
         if status != "OK":
             logger.warning(f"Google Places Details API returned non-OK status for place_id {place_id}: {status}")
+        else:
+            await _cache_set(cache_key, DETAILS_CACHE_TTL, data)
         
         return data
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error calling Google Places Details API for place_id {place_id}: {str(e)}", exc_info=True)
         raise
 
-def search_places_by_category(city: str, category: str) -> List[Dict]:
+async def get_place_details_bulk(place_ids: List[str], use_cache: bool = True) -> List[Union[Dict, Exception]]:
+    """
+    Fetch Place Details for several places concurrently.
+    Returns results in the same order as place_ids; a failed call yields the
+    raised exception in its slot instead of aborting the whole batch.
+    """
+    if not place_ids:
+        return []
+    semaphore = asyncio.Semaphore(DETAILS_MAX_CONCURRENCY)
+
+    async def _fetch(place_id: str) -> Dict:
+        async with semaphore:
+            return await get_place_details(place_id, use_cache=use_cache)
+
+    logger.info(f"Fetching Place Details for {len(place_ids)} places concurrently")
+    return await asyncio.gather(*[_fetch(place_id) for place_id in place_ids], return_exceptions=True)
+
+async def search_places_by_category(city: str, category: str, use_cache: bool = True) -> List[Dict]:
     """
     Search for places in a city by category
     Returns list of place results
@@ -118,7 +262,7 @@ def search_places_by_category(city: str, category: str) -> List[Dict]:
     next_page_token = None
     
     # Get first page
-    data = text_search(query)
+    data = await text_search(query, use_cache=use_cache)
     if data.get("status") == "OK":
         results.extend(data.get("results", []))
         next_page_token = data.get("next_page_token")
@@ -152,7 +296,7 @@ def format_place_data(place_result: Dict, category: str, city: str) -> Dict:
         "rating": place_result.get("rating"),
         "user_ratings_total": place_result.get("user_ratings_total"),
         "business_status": place_result.get("business_status"),
-        "types": json.dumps(place_result.get("types", [])),
+        "types": place_result.get("types", []),
         "postal_code": place_result.get("postal_code"),  # usually unavailable in text search
         "province": place_result.get("province"),  # usually unavailable in text search
         "suburb": place_result.get("suburb"),  # usually unavailable in text search
@@ -212,8 +356,8 @@ def format_place_details(place_details: Dict) -> Dict:
         "international_phone_number": result.get("international_phone_number"),
         "website": result.get("website"),
         "business_status": result.get("business_status"),
-        "types": json.dumps(result.get("types", [])),
-        "opening_hours": json.dumps(opening_hours_data) if opening_hours_data else None,
+        "types": result.get("types", []),
+        "opening_hours": opening_hours_data or None,
         "price_level": result.get("price_level"),
         "description": description,
         "photo_reference": photo_reference,
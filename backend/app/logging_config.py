@@ -1,8 +1,11 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 from pathlib import Path
+from typing import Optional
 
 # Create logs directory if it doesn't exist
 log_dir = Path("logs")
@@ -15,24 +18,43 @@ DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Get log level from environment or default to INFO
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
+# Background listener that owns the real (blocking) handlers
+_listener: Optional[QueueListener] = None
+
+def _stop_listener():
+    """
+    Flush queued records and stop the background logging listener, if running.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(_stop_listener)
+
 def setup_logging():
     """
     Configure logging for the application.
     Sets up both console and file logging.
+    
+    Loggers only enqueue records; a background QueueListener thread does the
+    console/file I/O so request handlers never block on disk writes.
     """
+    global _listener
+    
     # Root logger configuration
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
     
     # Clear any existing handlers
     root_logger.handlers.clear()
+    _stop_listener()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
     console_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
     
     # File handler with rotation
     file_handler = RotatingFileHandler(
@@ -43,7 +65,6 @@ def setup_logging():
     file_handler.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
     file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
     
     # Error file handler (only errors and above)
     error_file_handler = RotatingFileHandler(
@@ -53,7 +74,17 @@ def setup_logging():
     )
     error_file_handler.setLevel(logging.ERROR)
     error_file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(error_file_handler)
+    
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_file_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
     
     # Set specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
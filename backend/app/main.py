@@ -1,11 +1,16 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import os
+import re
 import time
 from .database import engine, Base
 from .routers import auth, places
+from .auth import shutdown_hash_pool
+from .google_places import close_client
 from .logging_config import setup_logging, get_logger
 
 # Setup logging
@@ -15,48 +20,71 @@ logger = get_logger(__name__)
 logger.info("Starting application...")
 
 # Create database tables
-# Note: For production, use Alembic migrations instead:
-#   alembic upgrade head
-# This create_all is kept for backward compatibility and development convenience
-try:
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created/verified successfully")
-except Exception as e:
-    logger.error(f"Error creating database tables: {str(e)}", exc_info=True)
-    raise
+# Schema is managed by Alembic (`alembic upgrade head` in the deployment script).
+# create_all issues schema introspection queries on every process start, so it only
+# runs when explicitly enabled (e.g. for local development with SQLite).
+if os.getenv("CREATE_ALL_ON_START", "false").lower() == "true":
+    try:
+        Base.metadata.create_all(bind=engine)
+        logger.info("Database tables created/verified successfully")
+    except Exception as e:
+        logger.error(f"Error creating database tables: {str(e)}", exc_info=True)
+        raise
+else:
+    logger.info("Skipping create_all on start (CREATE_ALL_ON_START not enabled); run 'alembic upgrade head' to manage schema")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_client()
+    logger.info("Google Places HTTP client closed")
+    shutdown_hash_pool()
+    logger.info("Password hash pool shut down")
 
 app = FastAPI(
     title="Company Info API",
     description="API for fetching and managing business data from Google Places API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# High-frequency probe/static paths that are not worth an access log line
+_UNLOGGED_PATHS = frozenset({"/health", "/favicon.ico", "/robots.txt"})
+_UNLOGGED_PREFIXES = ("/assets/",)
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
+    path = request.url.path
+    # Health probes and static assets are high-volume noise; skip logging them
+    if path in _UNLOGGED_PATHS or path.startswith(_UNLOGGED_PREFIXES):
+        return await call_next(request)
     
-    # Log request
-    logger.info(f"Request: {request.method} {request.url.path} - Client: {request.client.host if request.client else 'unknown'}")
+    start_ns = time.perf_counter_ns()
+    
+    # Log request (args are only formatted if the record is emitted)
+    logger.info(
+        "Request: %s %s - Client: %s",
+        request.method, path, request.client.host if request.client else "unknown"
+    )
     
     try:
         response = await call_next(request)
-        process_time = time.time() - start_time
+        elapsed_us = (time.perf_counter_ns() - start_ns) // 1000
         
         # Log response
         logger.info(
-            f"Response: {request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
+            "Response: %s %s - Status: %d - Time: %dus",
+            request.method, path, response.status_code, elapsed_us
         )
         
         return response
     except Exception as e:
-        process_time = time.time() - start_time
+        elapsed_us = (time.perf_counter_ns() - start_ns) // 1000
         logger.error(
-            f"Error processing request: {request.method} {request.url.path} - "
-            f"Time: {process_time:.3f}s - "
-            f"Error: {str(e)}",
+            "Error processing request: %s %s - Time: %dus - Error: %s",
+            request.method, path, elapsed_us, e,
             exc_info=True
         )
         raise
@@ -90,31 +118,38 @@ if not os.path.exists(frontend_dist):
     # Try Docker path
     frontend_dist = "/app/frontend/dist"
 
+# Backend-owned path prefixes that must 404 rather than fall back to the SPA.
+# Matches whole path segments, so e.g. "/apiary" still resolves to the frontend.
+_API_PATH_RE = re.compile(r"^(api|docs|redoc|openapi\.json|health)(/|$)")
+# Missing build assets and static files (e.g. a stale /assets/index-abc123.js or
+# /favicon.ico) must 404 too, not be answered with index.html as text/html. Only
+# known static extensions count, so client routes like /user/john.doe still work.
+_FILE_PATH_RE = re.compile(
+    r"^assets(/|$)"
+    r"|\.(js|mjs|css|map|json|ico|png|jpe?g|gif|svg|webp|avif|woff2?|ttf|otf|eot|txt|xml|webmanifest|wasm)$",
+    re.IGNORECASE,
+)
+
+class SPAStaticFiles(StaticFiles):
+    """
+    StaticFiles that falls back to index.html for unknown non-API, non-file paths,
+    so client-side routes resolve to the SPA.
+    """
+    async def get_response(self, path: str, scope):
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            if e.status_code != 404 or _API_PATH_RE.match(path) or _FILE_PATH_RE.search(path):
+                raise
+            return await super().get_response("index.html", scope)
+
 if os.path.exists(frontend_dist):
     logger.info(f"Frontend found at: {frontend_dist}")
-
-    app.mount("/", StaticFiles(directory=frontend_dist, html=True), name="static")
-    # Mount static assets
-    assets_path = os.path.join(frontend_dist, "assets")
-    if os.path.exists(assets_path):
-        app.mount("/assets", StaticFiles(directory=assets_path), name="assets")
-        logger.info(f"Static assets mounted from: {assets_path}")
     
-    # Serve index.html for all non-API routes (must be last)
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
-        # Don't interfere with API routes or docs
-        if (full_path.startswith("api") or 
-            full_path.startswith("docs") or 
-            full_path.startswith("openapi.json") or 
-            full_path == "health"):
-            return {"error": "Not found"}
-        index_path = os.path.join(frontend_dist, "index.html")
-        if os.path.exists(index_path):
-            logger.debug(f"Serving frontend for path: {full_path}")
-            return FileResponse(index_path)
-        logger.warning(f"Frontend index.html not found at: {index_path}")
-        return {"error": "Frontend not found"}
+    # Mounted after all API routes so the router matches those first; unknown paths
+    # fall through to the static files (served with ETag/304 support).
+    app.mount("/", SPAStaticFiles(directory=frontend_dist, html=True), name="spa")
+    logger.info(f"Static frontend mounted from: {frontend_dist}")
 else:
     logger.warning(f"Frontend not found at: {frontend_dist}")
 
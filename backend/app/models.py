@@ -1,12 +1,22 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, ForeignKey, Boolean, Index, UniqueConstraint, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import func, text
 from .database import Base
+import os
+
+# Set SQLALCHEMY_RAISE_ON_LAZY_LOAD=true in development to turn accidental lazy
+# loads (N+1 queries) into errors; relationships must then be eager-loaded.
+RAISE_ON_LAZY_LOAD = os.getenv("SQLALCHEMY_RAISE_ON_LAZY_LOAD", "false").lower() == "true"
+RELATIONSHIP_LAZY = "raise" if RAISE_ON_LAZY_LOAD else "select"
+
+# Native JSON (JSONB on Postgres); None is stored as SQL NULL so COALESCE in the upsert still works
+JSONType = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
 
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
@@ -16,20 +26,31 @@ class User(Base):
 class SearchQuery(Base):
     __tablename__ = "search_queries"
     
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    category = Column(String, nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    city = Column(String, nullable=False)
+    category = Column(String, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    places = relationship("Place", back_populates="search_query", cascade="all, delete-orphan")
-    user = relationship("User")
+    places = relationship("Place", back_populates="search_query", cascade="all, delete-orphan", lazy=RELATIONSHIP_LAZY)
+    user = relationship("User", lazy=RELATIONSHIP_LAZY)
+    
+    @validates("city", "category")
+    def _normalize_search_term(self, key, value):
+        # Lookups match on the normalized form, so never store anything else
+        return value.strip().lower() if value is not None else value
+    
+    __table_args__ = (
+        # One saved search per user/city/category; its index serves the search lookup
+        UniqueConstraint("city", "category", "user_id", name="uq_search_queries_city_category_user"),
+        Index("ix_search_queries_user_created", "user_id", created_at.desc()),
+    )
 
 class Place(Base):
     __tablename__ = "places"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     place_id = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, nullable=False)
     address = Column(String)
@@ -42,10 +63,10 @@ class Place(Base):
     phone_number = Column(String)
     website = Column(String)
     business_status = Column(String)
-    types = Column(Text)  # JSON string of types
+    types = Column(JSONType)  # List of Google place types
     formatted_address = Column(String)
     international_phone_number = Column(String)
-    opening_hours = Column(Text)  # JSON string
+    opening_hours = Column(JSONType)  # weekday_text/periods/open_now
     price_level = Column(Integer)
     description = Column(Text)  # Place description/review summary
     photo_reference = Column(String)  # Photo reference from Google Places
@@ -61,4 +82,15 @@ class Place(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    search_query = relationship("SearchQuery", back_populates="places")
+    search_query = relationship("SearchQuery", back_populates="places", lazy=RELATIONSHIP_LAZY)
+    
+    __table_args__ = (
+        Index("ix_places_sqid", "search_query_id"),
+        # Partial index over rows still waiting for Place Details
+        Index(
+            "ix_places_pending",
+            "search_query_id",
+            postgresql_where=text("has_details = false"),
+            sqlite_where=text("has_details = 0"),
+        ),
+    )
@@ -1,29 +1,90 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import bindparam, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from typing import Any, List, Optional
 from ..database import get_db
 from ..models import User, SearchQuery, Place
 from ..schemas import (
     SearchRequest,
     SearchQueryResponse,
-    PlaceResponse,
-    RefreshRequest
+    SearchQueryListItem,
+    PlaceDict,
+    RefreshRequest,
+    SEARCH_QUERY_RESPONSE_ADAPTER,
+    PLACE_LIST_ADAPTER,
+    QUERY_LIST_ADAPTER
 )
 from ..auth import get_current_active_user
 from ..google_places import (
     search_places_by_category,
-    get_place_details,
+    get_place_details_bulk,
     format_place_data,
     format_place_details,
     is_google_access_allowed
 )
 from ..logging_config import get_logger
-import json
+import hashlib
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/places", tags=["places"])
 
+# Hot-path statements are built once so SQLAlchemy's compiled-SQL cache is hit
+# on every request instead of re-walking a fresh expression tree.
+_STMT_SEARCH_LOOKUP = select(SearchQuery.id).where(
+    SearchQuery.city == bindparam("city"),
+    SearchQuery.category == bindparam("category"),
+    SearchQuery.user_id == bindparam("user_id")
+)
+# Responses are built from column mappings rather than ORM objects
+_STMT_USER_SEARCH_QUERY_ROW = select(
+    SearchQuery.id,
+    SearchQuery.city,
+    SearchQuery.category,
+    SearchQuery.created_at,
+    SearchQuery.updated_at
+).where(
+    SearchQuery.id == bindparam("query_id"),
+    SearchQuery.user_id == bindparam("user_id")
+)
+_STMT_USER_QUERY_SUMMARIES = select(
+    SearchQuery.id,
+    SearchQuery.city,
+    SearchQuery.category,
+    SearchQuery.created_at,
+    SearchQuery.updated_at,
+    func.count(Place.id).label("place_count")
+).outerjoin(Place, Place.search_query_id == SearchQuery.id).where(
+    SearchQuery.user_id == bindparam("user_id")
+).group_by(SearchQuery.id).order_by(SearchQuery.created_at.desc())
+# One aggregate row per owned query (none if not owned) that changes whenever its places do
+_STMT_USER_QUERY_VERSION = select(
+    SearchQuery.updated_at,
+    func.count(Place.id),
+    func.count(Place.id).filter(Place.has_details == True),
+    func.max(Place.id),
+    func.max(Place.created_at),
+    func.max(Place.updated_at)
+).outerjoin(Place, Place.search_query_id == SearchQuery.id).where(
+    SearchQuery.id == bindparam("query_id"),
+    SearchQuery.user_id == bindparam("user_id")
+).group_by(SearchQuery.id)
+_STMT_QUERY_PLACES = select(*Place.__table__.columns).where(Place.search_query_id == bindparam("search_query_id"))
+_PENDING_DETAILS_FILTER = (
+    Place.search_query_id == bindparam("search_query_id"),
+    Place.has_details == False
+)
+# Only the columns needed to call the API and address the row for the bulk update
+_STMT_ALL_PENDING_DETAILS = select(Place.id, Place.place_id, Place.name).where(*_PENDING_DETAILS_FILTER)
+_STMT_PENDING_DETAILS = _STMT_ALL_PENDING_DETAILS.limit(bindparam("limit"))
+_STMT_DELETE_PLACES = delete(Place).where(Place.search_query_id == bindparam("search_query_id"))
+_STMT_DELETE_SEARCH_QUERY = delete(SearchQuery).where(SearchQuery.id == bindparam("search_query_id"))
+
 def _ensure_google_access(current_user: User):
     if not is_google_access_allowed(current_user.email):
         logger.warning(f"User {current_user.email} attempted Google API access but is not allowlisted")
@@ -32,30 +93,136 @@ def _ensure_google_access(current_user: User):
             detail="Google API access is restricted for this account"
         )
 
-def _upsert_place(db: Session, place_info: dict, search_query_id: int) -> Place:
+def _get_query_etag(db: Session, query_id: int, user_id: int, representation: str) -> Optional[str]:
+    """
+    Return a weak ETag for a search query and its places, or None if the user doesn't own it.
+    representation prefixes the tag so endpoints serving different bodies from the
+    same version never share a validator.
+    """
+    version = db.execute(
+        _STMT_USER_QUERY_VERSION, {"query_id": query_id, "user_id": user_id}
+    ).first()
+    if version is None:
+        return None
+    digest = hashlib.blake2b(repr(tuple(version)).encode(), digest_size=8).hexdigest()
+    return f'W/"{representation}-{digest}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    # Weak comparison: W/ prefixes are ignored (RFC 9110, section 13.1.2)
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+def _json_response(adapter: TypeAdapter, obj: Any, headers: Optional[dict] = None) -> Response:
+    """
+    Validate row mappings with a prebuilt adapter and return its JSON bytes directly,
+    so FastAPI doesn't validate and serialize the payload a second time.
+    """
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(obj)),
+        media_type="application/json",
+        headers=headers
+    )
+
+def _get_user_search_query_row(db: Session, query_id: int, user_id: int):
+    return db.execute(
+        _STMT_USER_SEARCH_QUERY_ROW, {"query_id": query_id, "user_id": user_id}
+    ).mappings().first()
+
+def _get_user_search_query(db: Session, query_id: int, user_id: int) -> Optional[dict]:
+    """
+    Load a search query owned by user_id and its places as plain column mappings
+    (two queries, no ORM objects), shaped like SearchQueryResponse.
+    """
+    search_query = _get_user_search_query_row(db, query_id, user_id)
+    if search_query is None:
+        return None
+    places = db.execute(_STMT_QUERY_PLACES, {"search_query_id": query_id}).mappings().all()
+    return {**search_query, "places": places}
+
+def _upsert_places(db: Session, rows: List[dict], search_query_id: int) -> None:
+    """
+    Insert or update places by place_id in a single multi-row statement.
+    Existing rows are re-pointed at search_query_id; incoming NULLs never overwrite
+    stored values, so detail fields from an earlier Place Details call are preserved
+    when the payload comes from a text search.
+    """
+    if not rows:
+        return
+    # Deduplicate by place_id: ON CONFLICT cannot touch the same row twice per statement
+    rows = list({row["place_id"]: {**row, "search_query_id": search_query_id} for row in rows}.values())
+    
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = pg_insert(Place).values(rows)
+    else:
+        stmt = sqlite_insert(Place).values(rows)
+    
+    table = Place.__table__
+    set_ = {
+        key: func.coalesce(stmt.excluded[key], table.c[key])
+        for key in rows[0]
+        if key not in ("place_id", "search_query_id", "has_details")
+    }
+    set_["search_query_id"] = stmt.excluded.search_query_id
+    # If details were already fetched, keep them
+    set_["has_details"] = or_(table.c.has_details, stmt.excluded.has_details)
+    set_["updated_at"] = func.now()
+    
+    db.execute(stmt.on_conflict_do_update(index_elements=["place_id"], set_=set_))
+
+# The Session is synchronous, so the async handlers below run each block of DB work
+# through run_in_threadpool and only await the Google API calls on the event loop.
+def _lookup_search_query_id(db: Session, city: str, category: str, user_id: int) -> Optional[int]:
+    return db.execute(
+        _STMT_SEARCH_LOOKUP, {"city": city, "category": category, "user_id": user_id}
+    ).scalar()
+
+def _search_query_response(db: Session, query_id: int, user_id: int) -> Response:
+    return _json_response(SEARCH_QUERY_RESPONSE_ADAPTER, _get_user_search_query(db, query_id, user_id))
+
+def _create_search_query(db: Session, city: str, category: str, user_id: int) -> Optional[int]:
+    """
+    Insert and commit a search query, returning its id, or None if the same search
+    was created concurrently.
+    """
+    search_query = SearchQuery(city=city, category=category, user_id=user_id)
+    db.add(search_query)
+    try:
+        # Flush to get the primary key, so nothing has to reload the expired row after commit
+        db.flush()
+        search_query_id = search_query.id
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return None
+    return search_query_id
+
+def _save_places(db: Session, rows: List[dict], search_query_id: int, replace: bool = False) -> int:
     """
-    Insert or update a place by place_id.
-    Preserves existing detail fields if we are overwriting with a text-search payload
-    that lacks detailed data.
+    Upsert rows for a search query and commit. With replace=True the query's existing
+    places are deleted first, in the same transaction; returns the number deleted.
     """
-    place_id = place_info.get("place_id")
-    existing = db.query(Place).filter(Place.place_id == place_id).first()
-    if existing:
-        for key, value in place_info.items():
-            if value is not None:
-                setattr(existing, key, value)
-        existing.search_query_id = search_query_id
-        # If details were already fetched, keep them
-        if existing.has_details:
-            existing.has_details = True
-        db.add(existing)
-        return existing
-    place = Place(**place_info, search_query_id=search_query_id)
-    db.add(place)
-    return place
+    deleted_count = 0
+    if replace:
+        deleted_count = db.execute(
+            _STMT_DELETE_PLACES, {"search_query_id": search_query_id},
+            execution_options={"synchronize_session": False}
+        ).rowcount
+    _upsert_places(db, rows, search_query_id)
+    db.commit()
+    return deleted_count
+
+def _delete_search_query(db: Session, search_query_id: int) -> None:
+    db.rollback()
+    db.execute(_STMT_DELETE_PLACES, {"search_query_id": search_query_id}, execution_options={"synchronize_session": False})
+    db.execute(_STMT_DELETE_SEARCH_QUERY, {"search_query_id": search_query_id}, execution_options={"synchronize_session": False})
+    db.commit()
 
 @router.post("/search", response_model=SearchQueryResponse)
-def search_places(
+async def search_places(
     search_request: SearchRequest,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -64,99 +231,96 @@ def search_places(
     Search for places by city and category.
     Returns existing data if available, otherwise fetches from Google Places API.
     """
-    city = search_request.city.lower().strip()
-    category = search_request.category.lower().strip()
+    # Already trimmed and lowercased by the SearchRequest schema
+    city = search_request.city
+    category = search_request.category
     
     logger.info(f"Search request from user {current_user.username} (ID: {current_user.id}): city='{city}', category='{category}', max_details={search_request.max_details}")
     
     # Check if search query already exists for this user
-    existing_query = db.query(SearchQuery).filter(
-        SearchQuery.city == city,
-        SearchQuery.category == category,
-        SearchQuery.user_id == current_user.id
-    ).first()
+    existing_query_id = await run_in_threadpool(_lookup_search_query_id, db, city, category, current_user.id)
     
-    if existing_query:
-        logger.info(f"Returning cached search query (ID: {existing_query.id}) with {len(existing_query.places)} places")
-        return existing_query
+    if existing_query_id is not None:
+        logger.info(f"Returning cached search query (ID: {existing_query_id})")
+        return await run_in_threadpool(_search_query_response, db, existing_query_id, current_user.id)
     
     _ensure_google_access(current_user)
     
     # Create new search query
     logger.info(f"Creating new search query for city='{city}', category='{category}' for user {current_user.username}")
-    search_query = SearchQuery(city=city, category=category, user_id=current_user.id)
-    db.add(search_query)
-    db.commit()
-    db.refresh(search_query)
+    search_query_id = await run_in_threadpool(_create_search_query, db, city, category, current_user.id)
+    if search_query_id is None:
+        # A concurrent request created the same search first; return that one
+        logger.info(f"Search query for city='{city}', category='{category}' was created concurrently, returning it")
+        existing_query_id = await run_in_threadpool(_lookup_search_query_id, db, city, category, current_user.id)
+        return await run_in_threadpool(_search_query_response, db, existing_query_id, current_user.id)
     
     # Fetch places from Google Places API
     try:
         logger.info(f"Fetching places from Google Places API for city='{city}', category='{category}'")
-        places_data = search_places_by_category(city, category)
+        places_data = await search_places_by_category(city, category)
         logger.info(f"Received {len(places_data)} places from Google Places API")
         
-        for place_data in places_data:
-            place_info = format_place_data(place_data, category, city)
-            _upsert_place(db, place_info, search_query.id)
-        
-        db.commit()
-        db.refresh(search_query)
-        logger.info(f"Saved {len(search_query.places)} places to database (SearchQuery ID: {search_query.id})")
+        rows = [format_place_data(place_data, category, city) for place_data in places_data]
+        await run_in_threadpool(_save_places, db, rows, search_query_id)
+        logger.info(f"Saved {len(places_data)} places to database (SearchQuery ID: {search_query_id})")
         
         # Optionally fetch place details (limited by max_details)
         if search_request.max_details and search_request.max_details > 0:
             logger.info(f"Fetching place details for up to {search_request.max_details} places (limited by max_details parameter)")
-            fetch_place_details(db, search_query.id, search_request.max_details)
-            db.refresh(search_query)
-            logger.info(f"Place details fetch completed for search query ID {search_query.id}")
+            await fetch_place_details(db, search_query_id, search_request.max_details)
+            logger.info(f"Place details fetch completed for search query ID {search_query_id}")
         else:
             logger.info(f"max_details not provided or set to 0, skipping place details fetch")
-        
-        return search_query
     
     except Exception as e:
         logger.error(f"Error fetching places for city='{city}', category='{category}': {str(e)}", exc_info=True)
-        db.delete(search_query)
-        db.commit()
+        await run_in_threadpool(_delete_search_query, db, search_query_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error fetching places: {str(e)}"
         )
+    
+    # Outside the try: the places are saved by now, so a failure building the
+    # response must not delete the search
+    return await run_in_threadpool(_search_query_response, db, search_query_id, current_user.id)
 
-@router.get("/queries", response_model=List[SearchQueryResponse])
+@router.get("/queries", response_model=List[SearchQueryListItem])
 def get_all_queries(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all search queries for the current user"""
+    """Get all search queries for the current user (summaries with place counts, newest first)"""
     logger.debug(f"User {current_user.username} requested all search queries")
-    queries = db.query(SearchQuery).filter(SearchQuery.user_id == current_user.id).all()
+    queries = db.execute(_STMT_USER_QUERY_SUMMARIES, {"user_id": current_user.id}).mappings().all()
     logger.info(f"Returning {len(queries)} search queries for user {current_user.username}")
-    return queries
+    return _json_response(QUERY_LIST_ADAPTER, queries)
 
 @router.get("/queries/{query_id}", response_model=SearchQueryResponse)
 def get_query(
     query_id: int,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific search query with places (only if it belongs to the current user)"""
     logger.debug(f"User {current_user.username} requested search query ID: {query_id}")
-    query = db.query(SearchQuery).filter(
-        SearchQuery.id == query_id,
-        SearchQuery.user_id == current_user.id
-    ).first()
-    if not query:
+    etag = _get_query_etag(db, query_id, current_user.id, "q")
+    if etag is None:
         logger.warning(f"Search query ID {query_id} not found or doesn't belong to user {current_user.username}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Search query not found"
         )
-    logger.info(f"Returning search query ID {query_id} with {len(query.places)} places")
-    return query
+    if _etag_matches(request, etag):
+        logger.debug(f"Search query ID {query_id} not modified")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    query = _get_user_search_query(db, query_id, current_user.id)
+    logger.info(f"Returning search query ID {query_id} with {len(query['places'])} places")
+    return _json_response(SEARCH_QUERY_RESPONSE_ADAPTER, query, {"ETag": etag})
 
 @router.post("/refresh", response_model=SearchQueryResponse)
-def refresh_places(
+async def refresh_places(
     refresh_request: RefreshRequest,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -171,10 +335,10 @@ def refresh_places(
         f"max_details={refresh_request.max_details}"
     )
     
-    search_query = db.query(SearchQuery).filter(
-        SearchQuery.id == refresh_request.search_query_id,
-        SearchQuery.user_id == current_user.id
-    ).first()
+    # Plain column mapping, so reading it after the commits below never reloads the row
+    search_query = await run_in_threadpool(
+        _get_user_search_query_row, db, refresh_request.search_query_id, current_user.id
+    )
     
     if not search_query:
         logger.warning(f"Search query ID {refresh_request.search_query_id} not found or doesn't belong to user {current_user.username}")
@@ -188,44 +352,35 @@ def refresh_places(
             _ensure_google_access(current_user)
         
         if refresh_request.refresh_text_search:
-            logger.info(f"Refreshing text search for query ID {search_query.id} (city='{search_query.city}', category='{search_query.category}')")
-            # Delete existing places
-            deleted_count = db.query(Place).filter(
-                Place.search_query_id == search_query.id
-            ).count()
-            db.query(Place).filter(
-                Place.search_query_id == search_query.id
-            ).delete()
-            logger.info(f"Deleted {deleted_count} existing places")
-            
+            logger.info(f"Refreshing text search for query ID {search_query['id']} (city='{search_query['city']}', category='{search_query['category']}')")
             # Fetch new places
-            places_data = search_places_by_category(search_query.city, search_query.category)
+            # Refreshes bypass cached API responses; the fresh ones replace them
+            places_data = await search_places_by_category(
+                search_query["city"], search_query["category"], use_cache=False
+            )
             logger.info(f"Fetched {len(places_data)} places from Google Places API")
             
-            for place_data in places_data:
-                place_info = format_place_data(place_data, search_query.category, search_query.city)
-                _upsert_place(db, place_info, search_query.id)
-            
-            db.commit()
+            rows = [
+                format_place_data(place_data, search_query["category"], search_query["city"])
+                for place_data in places_data
+            ]
+            # Replace existing places in one transaction
+            deleted_count = await run_in_threadpool(_save_places, db, rows, search_query["id"], True)
+            logger.info(f"Deleted {deleted_count} existing places")
             logger.info(f"Saved {len(places_data)} new places to database")
         
         if refresh_request.refresh_details:
             # Use max_details if provided, otherwise fetch details for all places without details
             if refresh_request.max_details and refresh_request.max_details > 0:
                 max_details = refresh_request.max_details
+                logger.info(f"Refreshing place details for up to {max_details} places")
             else:
-                # Count places without details
-                places_without_details = db.query(Place).filter(
-                    Place.search_query_id == search_query.id,
-                    Place.has_details == False
-                ).count()
-                max_details = places_without_details
-            logger.info(f"Refreshing place details for up to {max_details} places")
-            fetch_place_details(db, search_query.id, max_details)
+                max_details = None
+                logger.info("Refreshing place details for all places without details")
+            await fetch_place_details(db, search_query["id"], max_details, use_cache=False)
         
-        db.refresh(search_query)
-        logger.info(f"Refresh completed for search query ID {search_query.id}")
-        return search_query
+        logger.info(f"Refresh completed for search query ID {search_query['id']}")
+        return await run_in_threadpool(_search_query_response, db, search_query["id"], current_user.id)
     
     except Exception as e:
         logger.error(f"Error refreshing places for query ID {refresh_request.search_query_id}: {str(e)}", exc_info=True)
@@ -234,67 +389,76 @@ def refresh_places(
             detail=f"Error refreshing places: {str(e)}"
         )
 
-@router.get("/queries/{query_id}/places", response_model=List[PlaceResponse])
+@router.get("/queries/{query_id}/places", response_model=List[PlaceDict])
 def get_places(
     query_id: int,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get all places for a search query (only if it belongs to the current user)"""
     logger.debug(f"User {current_user.username} requested places for query ID: {query_id}")
-    search_query = db.query(SearchQuery).filter(
-        SearchQuery.id == query_id,
-        SearchQuery.user_id == current_user.id
-    ).first()
-    if not search_query:
+    etag = _get_query_etag(db, query_id, current_user.id, "p")
+    if etag is None:
         logger.warning(f"Search query ID {query_id} not found or doesn't belong to user {current_user.username}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Search query not found"
         )
-    logger.info(f"Returning {len(search_query.places)} places for query ID {query_id}")
-    return search_query.places
+    if _etag_matches(request, etag):
+        logger.debug(f"Places for query ID {query_id} not modified")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    places = db.execute(_STMT_QUERY_PLACES, {"search_query_id": query_id}).mappings().all()
+    logger.info(f"Returning {len(places)} places for query ID {query_id}")
+    return _json_response(PLACE_LIST_ADAPTER, places, {"ETag": etag})
 
-def fetch_place_details(db: Session, search_query_id: int, max_details: int):
+def _load_pending_details(db: Session, search_query_id: int, max_details: Optional[int]) -> list:
+    if max_details is None:
+        return db.execute(_STMT_ALL_PENDING_DETAILS, {"search_query_id": search_query_id}).all()
+    return db.execute(
+        _STMT_PENDING_DETAILS, {"search_query_id": search_query_id, "limit": max_details}
+    ).all()
+
+def _save_place_details(db: Session, updates: List[dict]) -> None:
+    if updates:
+        # ORM bulk UPDATE by primary key: executemany instead of per-object flushes
+        db.execute(update(Place), updates)
+    db.commit()
+
+async def fetch_place_details(
+    db: Session, search_query_id: int, max_details: Optional[int], use_cache: bool = True
+):
     """
     Fetch place details for places that don't have details yet
-    Limited by max_details parameter to control API usage
+    Limited by max_details parameter to control API usage (None fetches all pending places)
     """
-    # Count total places without details
-    total_without_details = db.query(Place).filter(
-        Place.search_query_id == search_query_id,
-        Place.has_details == False
-    ).count()
-    
     # Fetch only up to max_details places
-    places = db.query(Place).filter(
-        Place.search_query_id == search_query_id,
-        Place.has_details == False
-    ).limit(max_details).all()
+    places = await run_in_threadpool(_load_pending_details, db, search_query_id, max_details)
     
-    logger.info(f"Fetching details for {len(places)} places (max_details={max_details}, total without details={total_without_details}, query ID: {search_query_id})")
+    logger.info(f"Fetching details for {len(places)} places (max_details={max_details}, query ID: {search_query_id})")
     success_count = 0
     error_count = 0
     
-    for place in places:
-        try:
-            details_data = get_place_details(place.place_id)
-            if details_data.get("status") == "OK":
-                details = format_place_details(details_data)
-                # Update place with details
-                for key, value in details.items():
-                    if value is not None:
-                        setattr(place, key, value)
-                place.has_details = True
-                success_count += 1
-                logger.debug(f"Successfully fetched details for place: {place.name} (ID: {place.place_id})")
-            else:
-                logger.warning(f"Google Places API returned status '{details_data.get('status')}' for place ID: {place.place_id}")
-                error_count += 1
-        except Exception as e:
+    updates = []
+    results = await get_place_details_bulk([place.place_id for place in places], use_cache=use_cache)
+    for place, details_data in zip(places, results):
+        if isinstance(details_data, Exception):
             error_count += 1
-            logger.error(f"Error fetching details for place {place.place_id} ({place.name}): {str(e)}", exc_info=True)
+            logger.error(f"Error fetching details for place {place.place_id} ({place.name}): {str(details_data)}", exc_info=details_data)
             continue
+        if details_data.get("status") == "OK":
+            details = format_place_details(details_data)
+            # Only overwrite columns the details response actually provided
+            updates.append({
+                "id": place.id,
+                **{key: value for key, value in details.items() if value is not None},
+                "has_details": True
+            })
+            success_count += 1
+            logger.debug(f"Successfully fetched details for place: {place.name} (ID: {place.place_id})")
+        else:
+            logger.warning(f"Google Places API returned status '{details_data.get('status')}' for place ID: {place.place_id}")
+            error_count += 1
     
-    db.commit()
+    await run_in_threadpool(_save_place_details, db, updates)
     logger.info(f"Place details fetch completed: {success_count} successful, {error_count} errors")
@@ -1,36 +1,46 @@
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
+from typing import Annotated, Any, Dict, Literal, Optional, List, Union
+from typing_extensions import TypedDict  # pydantic needs this TypedDict on Python < 3.12
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+
+# City/category as stored on SearchQuery: trimmed and lowercased during validation
+SearchTerm = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
+
+# Response DTOs are read-only: frozen, extra keys ignored, instances never revalidated
+READ_MODEL_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    frozen=True,
+    revalidate_instances="never",
+    defer_build=True
+)
+
+@lru_cache(maxsize=None)
+def _email_adapter() -> TypeAdapter:
+    """
+    Single shared EmailStr validator, reused across model rebuilds. Built on first
+    use so importing this module doesn't load email_validator.
+    """
+    return TypeAdapter(EmailStr)
+
+# Registration constraints, checked inside pydantic-core. Argon2 has no input length
+# limit; the cap only bounds the work a single request can hand to the hasher.
+Username = Annotated[str, StringConstraints(strip_whitespace=True, min_length=3, max_length=50)]
+Password = Annotated[str, StringConstraints(min_length=8, max_length=256)]
 
 # User schemas
 class UserCreate(BaseModel):
-    username: str
-    email: EmailStr
-    password: str
-    
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        if not v:
-            raise ValueError('Password cannot be empty')
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        # Bcrypt has a 72-byte limit. We'll use 72 characters as a safe limit
-        # (assuming ASCII/UTF-8 single-byte characters)
-        if len(v.encode('utf-8')) > 72:
-            raise ValueError('Password cannot be longer than 72 characters')
-        return v
+    username: Username
+    email: str
+    password: Password
     
-    @field_validator('username')
+    @field_validator('email')
     @classmethod
-    def validate_username(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('Username cannot be empty')
-        if len(v) < 3:
-            raise ValueError('Username must be at least 3 characters long')
-        if len(v) > 50:
-            raise ValueError('Username cannot be longer than 50 characters')
-        return v.strip()
+    def validate_email(cls, v: str) -> str:
+        return _email_adapter().validate_python(v)
 
 class UserResponse(BaseModel):
     id: int
@@ -39,79 +49,97 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = READ_MODEL_CONFIG
 
-# Auth schemas
-class Token(BaseModel):
+# Auth schemas: plain dict shapes, no model instances needed for two string fields
+class Token(TypedDict):
     access_token: str
-    token_type: str
+    token_type: Literal["bearer"]
 
-class TokenData(BaseModel):
-    username: Optional[str] = None
+class TokenData(TypedDict, total=False):
+    username: str
 
-# Place schemas
-class PlaceBase(BaseModel):
-    place_id: str
-    name: str
-    address: Optional[str] = None
-    city: Optional[str] = None
-    category: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
-    rating: Optional[float] = None
-    user_ratings_total: Optional[int] = None
-    phone_number: Optional[str] = None
-    website: Optional[str] = None
-    business_status: Optional[str] = None
-    types: Optional[str] = None
-    formatted_address: Optional[str] = None
-    international_phone_number: Optional[str] = None
-    opening_hours: Optional[str] = None
-    price_level: Optional[int] = None
-    description: Optional[str] = None
-    photo_reference: Optional[str] = None
-    photo_url: Optional[str] = None
-    email: Optional[str] = None
-    owner: Optional[str] = None
-    postal_code: Optional[str] = None
-    province: Optional[str] = None
-    suburb: Optional[str] = None
-    service_type: Optional[str] = None
-    has_details: bool = False
-
-class PlaceCreate(PlaceBase):
-    search_query_id: int
+# Closed value sets documented for the Google Places API. Known values validate to
+# the enum/Literal; anything Google adds later (or an odd stored value) falls through
+# to the plain type instead of failing the response.
+class BusinessStatus(str, Enum):
+    OPERATIONAL = "OPERATIONAL"
+    CLOSED_TEMPORARILY = "CLOSED_TEMPORARILY"
+    CLOSED_PERMANENTLY = "CLOSED_PERMANENTLY"
 
-class PlaceResponse(PlaceBase):
+PriceLevel = Literal[0, 1, 2, 3, 4]
+
+BusinessStatusField = Annotated[Union[BusinessStatus, str], Field(union_mode="left_to_right")]
+PriceLevelField = Annotated[Union[PriceLevel, int], Field(union_mode="left_to_right")]
+
+# Place schemas: read-only projection of a places row. Responses are built from
+# column mappings, so a TypedDict is enough and no model instances are created.
+class PlaceDict(TypedDict):
     id: int
+    place_id: str
+    name: str
+    address: Optional[str]
+    city: Optional[str]
+    category: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    rating: Optional[float]
+    user_ratings_total: Optional[int]
+    phone_number: Optional[str]
+    website: Optional[str]
+    business_status: Optional[BusinessStatusField]
+    types: Optional[List[str]]
+    formatted_address: Optional[str]
+    international_phone_number: Optional[str]
+    opening_hours: Optional[Dict[str, Any]]
+    price_level: Optional[PriceLevelField]
+    description: Optional[str]
+    photo_reference: Optional[str]
+    photo_url: Optional[str]
+    email: Optional[str]
+    owner: Optional[str]
+    postal_code: Optional[str]
+    province: Optional[str]
+    suburb: Optional[str]
+    service_type: Optional[str]
+    has_details: bool
     search_query_id: int
     created_at: datetime
-    updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
+    updated_at: Optional[datetime]
 
 # Search Query schemas
-class SearchQueryCreate(BaseModel):
+# Built from a plain dict, so it can be a slotted dataclass without a per-instance
+# __dict__. The BaseModel DTOs read ORM objects or row mappings, which
+# pydantic dataclasses can't validate from.
+@dataclass(config=READ_MODEL_CONFIG, frozen=True, slots=True)
+class SearchQueryResponse:
+    id: int
     city: str
     category: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    places: List[PlaceDict] = Field(default_factory=list)
 
-class SearchQueryResponse(BaseModel):
+class SearchQueryListItem(BaseModel):
+    """Slim search query summary for list views (place count instead of places)"""
     id: int
     city: str
     category: str
     created_at: datetime
     updated_at: Optional[datetime] = None
-    places: List[PlaceResponse] = []
+    place_count: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = READ_MODEL_CONFIG
+
+# Built once at import and reused by every response, instead of resolving per request
+SEARCH_QUERY_RESPONSE_ADAPTER = TypeAdapter(SearchQueryResponse)
+PLACE_LIST_ADAPTER = TypeAdapter(List[PlaceDict])
+QUERY_LIST_ADAPTER = TypeAdapter(List[SearchQueryListItem])
 
 # Search request
 class SearchRequest(BaseModel):
-    city: str
-    category: str
+    city: SearchTerm
+    category: SearchTerm
     max_details: Optional[int] = None  # Limit Place Details API calls
 
 # Refresh request
@@ -0,0 +1,80 @@
+import os
+import tempfile
+
+# Configure the app before it is imported: a throwaway SQLite file, no Redis and no
+# email allowlist
+_TMP_DIR = tempfile.mkdtemp(prefix="company-info-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/test.db"
+os.environ["DB_TYPE"] = "sqlite"
+os.environ["GOOGLE_PLACES_API_KEY"] = "test-key"
+os.environ["SECRET_KEY"] = "test-secret-key-with-at-least-32-characters"
+os.environ["CREATE_ALL_ON_START"] = "false"
+os.environ["REDIS_URL"] = ""
+os.environ["ALLOW_EMAILS"] = ""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import auth, google_places
+from app.database import Base, engine
+from app.main import app
+
+
+class FakeGoogle:
+    """
+    Stands in for the Google Places HTTP calls. results is what Text Search returns
+    (or an exception to raise); details maps place_id to a Place Details result.
+    """
+    def __init__(self):
+        self.results = []
+        self.details = {}
+        self.calls = []
+
+    async def text_search(self, query, location=None, use_cache=True):
+        self.calls.append(("text_search", query, use_cache))
+        if isinstance(self.results, Exception):
+            raise self.results
+        return {"status": "OK", "results": self.results}
+
+    async def get_place_details(self, place_id, use_cache=True):
+        self.calls.append(("details", place_id, use_cache))
+        return {"status": "OK", "result": self.details.get(place_id, {})}
+
+
+@pytest.fixture(autouse=True)
+def database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    # Process-wide caches would otherwise carry users and tokens across tests
+    auth._USER_CACHE.clear()
+    auth._JWT_CACHE.clear()
+    auth._VERIFY_CACHE.clear()
+    yield
+
+
+@pytest.fixture
+def google(monkeypatch):
+    fake = FakeGoogle()
+    monkeypatch.setattr(google_places, "text_search", fake.text_search)
+    monkeypatch.setattr(google_places, "get_place_details", fake.get_place_details)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def auth_headers(client):
+    response = client.post(
+        "/api/auth/register",
+        json={"username": "alice", "email": "alice@example.com", "password": "password123"},
+    )
+    assert response.status_code == 201
+    response = client.post(
+        "/api/auth/login", data={"username": "alice@example.com", "password": "password123"}
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
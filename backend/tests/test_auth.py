@@ -0,0 +1,73 @@
+from passlib.hash import bcrypt
+
+from app.auth import pwd_context
+from app.database import SessionLocal
+from app.models import User
+
+
+def _register(client, username="bob", email="bob@example.com", password="password123"):
+    return client.post(
+        "/api/auth/register",
+        json={"username": username, "email": email, "password": password},
+    )
+
+
+def _login(client, email="bob@example.com", password="password123"):
+    return client.post("/api/auth/login", data={"username": email, "password": password})
+
+
+def test_register_and_login(client):
+    response = _register(client)
+    assert response.status_code == 201
+    assert response.json()["username"] == "bob"
+
+    response = _login(client)
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+
+    response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json()["email"] == "bob@example.com"
+
+
+def test_register_rejects_duplicates(client):
+    assert _register(client).status_code == 201
+
+    response = _register(client, email="other@example.com")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Username already registered"
+
+    response = _register(client, username="other")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_login_rejects_wrong_password(client):
+    _register(client)
+    assert _login(client, password="wrong-password").status_code == 401
+
+
+def test_password_length_is_checked_by_schema(client):
+    # More than 72 bytes (the old bcrypt limit) is fine for Argon2
+    assert _register(client, password="é" * 60).status_code == 201
+    assert _register(client, "short", "short@example.com", "x" * 7).status_code == 422
+    assert _register(client, "long", "long@example.com", "x" * 257).status_code == 422
+
+
+def test_login_rehashes_bcrypt_password(client):
+    with SessionLocal() as db:
+        db.add(User(
+            username="legacy",
+            email="legacy@example.com",
+            hashed_password=bcrypt.using(rounds=4).hash("password123"),
+        ))
+        db.commit()
+
+    assert _login(client, "legacy@example.com").status_code == 200
+
+    with SessionLocal() as db:
+        hashed_password = db.query(User.hashed_password).filter(User.username == "legacy").scalar()
+    assert hashed_password.startswith("$argon2")
+    assert not pwd_context.needs_update(hashed_password)
+    # The upgraded hash still verifies
+    assert _login(client, "legacy@example.com").status_code == 200
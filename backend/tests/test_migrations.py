@@ -0,0 +1,121 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.database import Base
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def alembic(url, *args):
+    # alembic/env.py binds to app.database.engine at import, so each run gets its own
+    # process pointed at the database under test
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "-c", str(BACKEND_DIR / "alembic.ini"), *args],
+        env={**os.environ, "DATABASE_URL": url},
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path}/migrations.db"
+
+
+def _schema(url):
+    engine = create_engine(url)
+    try:
+        inspector = inspect(engine)
+        return {
+            table: {
+                "columns": {column["name"] for column in inspector.get_columns(table)},
+                "indexes": {index["name"] for index in inspector.get_indexes(table)},
+                "unique": {uc["name"] for uc in inspector.get_unique_constraints(table)},
+            }
+            for table in ("users", "search_queries", "places")
+        }
+    finally:
+        engine.dispose()
+
+
+def _index_sql(url, name):
+    engine = create_engine(url)
+    try:
+        with engine.connect() as connection:
+            return connection.execute(
+                text("SELECT sql FROM sqlite_master WHERE name = :name"), {"name": name}
+            ).scalar()
+    finally:
+        engine.dispose()
+
+
+def test_upgrade_empty_database_matches_models(db_url):
+    alembic(db_url, "upgrade", "head")
+
+    schema = _schema(db_url)
+    for table in Base.metadata.sorted_tables:
+        assert schema[table.name]["columns"] == {column.name for column in table.columns}
+        expected_indexes = {index.name for index in table.indexes}
+        assert expected_indexes <= schema[table.name]["indexes"]
+    assert "uq_search_queries_city_category_user" in schema["search_queries"]["unique"]
+    # Redundant indexes dropped by 9c4f7a2d3e18 stay dropped
+    assert "ix_search_queries_user_id" not in schema["search_queries"]["indexes"]
+    assert "created_at DESC" in _index_sql(db_url, "ix_search_queries_user_created")
+
+
+def test_upgrade_database_built_by_create_all(db_url):
+    engine = create_engine(db_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    alembic(db_url, "upgrade", "head")
+
+    assert "created_at DESC" in _index_sql(db_url, "ix_search_queries_user_created")
+    assert "uq_search_queries_city_category_user" in _schema(db_url)["search_queries"]["unique"]
+
+
+def test_downgrade_to_base_and_upgrade_again(db_url):
+    alembic(db_url, "upgrade", "head")
+    alembic(db_url, "downgrade", "base")
+    alembic(db_url, "upgrade", "head")
+
+
+def test_unique_constraint_migration_dedupes_search_queries(db_url):
+    alembic(db_url, "upgrade", "c65ea952406e")
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO users (id, username, email, hashed_password) "
+            "VALUES (1, 'a', 'a@example.com', 'x'), (2, 'b', 'b@example.com', 'x')"
+        ))
+        connection.execute(text(
+            "INSERT INTO search_queries (id, city, category, user_id) VALUES "
+            "(1, 'Cape Town', 'cafe', 1), (2, 'cape town ', 'Cafe', 1), "
+            "(3, 'cape town', 'cafe', 1), (4, 'cape town', 'cafe', 2), (5, 'durban', 'bar', 1)"
+        ))
+        connection.execute(text(
+            "INSERT INTO places (place_id, name, search_query_id) VALUES "
+            "('p1', 'n', 1), ('p2', 'n', 2), ('p3', 'n', 3), ('p4', 'n', 4), ('p5', 'n', 5)"
+        ))
+    engine.dispose()
+
+    alembic(db_url, "upgrade", "head")
+
+    engine = create_engine(db_url)
+    with engine.connect() as connection:
+        queries = connection.execute(
+            text("SELECT id, city, category, user_id FROM search_queries ORDER BY id")
+        ).all()
+        places = dict(connection.execute(text("SELECT place_id, search_query_id FROM places")).all())
+    engine.dispose()
+    assert [tuple(row) for row in queries] == [
+        (1, "cape town", "cafe", 1),
+        (4, "cape town", "cafe", 2),
+        (5, "durban", "bar", 1),
+    ]
+    assert places == {"p1": 1, "p2": 1, "p3": 1, "p4": 4, "p5": 5}
@@ -0,0 +1,166 @@
+import httpx
+
+
+def text_search_result(place_id, name, **fields):
+    return {
+        "place_id": place_id,
+        "name": name,
+        "formatted_address": f"{name} street",
+        "geometry": {"location": {"lat": -33.9, "lng": 18.4}},
+        "types": ["cafe", "food"],
+        "business_status": "OPERATIONAL",
+        **fields,
+    }
+
+
+def _search(client, headers, city="Cape Town", category="Cafe", max_details=0):
+    return client.post(
+        "/api/places/search",
+        json={"city": city, "category": category, "max_details": max_details},
+        headers=headers,
+    )
+
+
+def test_search_saves_places_and_returns_cached_query(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One"), text_search_result("p2", "Two")]
+
+    response = _search(client, auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    # City and category are stored trimmed and lowercased
+    assert (body["city"], body["category"]) == ("cape town", "cafe")
+    assert sorted(place["place_id"] for place in body["places"]) == ["p1", "p2"]
+    assert body["places"][0]["types"] == ["cafe", "food"]
+
+    response = _search(client, auth_headers, city=" cape town ", category="CAFE")
+    assert response.status_code == 200
+    assert response.json()["id"] == body["id"]
+    assert [call[0] for call in google.calls] == ["text_search"]
+
+
+def test_search_fetches_details_up_to_max_details(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One"), text_search_result("p2", "Two")]
+    google.details = {
+        "p1": {"formatted_phone_number": "021 555 0101", "opening_hours": {"open_now": True}},
+        "p2": {"formatted_phone_number": "021 555 0202"},
+    }
+
+    places = _search(client, auth_headers, max_details=1).json()["places"]
+    assert sum(place["has_details"] for place in places) == 1
+
+
+def test_upsert_keeps_stored_details(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One")]
+    google.details = {
+        "p1": {
+            "formatted_phone_number": "021 555 0101",
+            "website": "https://one.example.com",
+            "opening_hours": {"open_now": True},
+        }
+    }
+    first = _search(client, auth_headers, max_details=1).json()
+    assert first["places"][0]["phone_number"] == "021 555 0101"
+
+    # The same place turns up in another search without any detail fields: it moves to
+    # the new query, and the NULLs from the text search don't overwrite stored values
+    google.results = [text_search_result("p1", "One renamed")]
+    second = _search(client, auth_headers, category="Coffee").json()
+    place = second["places"][0]
+    assert place["name"] == "One renamed"
+    assert place["phone_number"] == "021 555 0101"
+    assert place["website"] == "https://one.example.com"
+    assert place["opening_hours"] == {"open_now": True}
+    assert place["has_details"] is True
+    assert place["search_query_id"] == second["id"]
+
+    response = client.get(f"/api/places/queries/{first['id']}/places", headers=auth_headers)
+    assert response.json() == []
+
+
+def test_failed_google_call_removes_the_new_search(client, auth_headers, google):
+    google.results = httpx.ConnectError("boom")
+
+    response = _search(client, auth_headers)
+    assert response.status_code == 500
+    assert client.get("/api/places/queries", headers=auth_headers).json() == []
+
+
+def test_refresh_bypasses_the_response_cache(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One")]
+    query_id = _search(client, auth_headers).json()["id"]
+
+    google.results = [text_search_result("p2", "Two")]
+    response = client.post(
+        "/api/places/refresh",
+        json={"search_query_id": query_id, "refresh_text_search": True, "refresh_details": True},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert [place["place_id"] for place in response.json()["places"]] == ["p2"]
+    assert google.calls[0] == ("text_search", "cafe in cape town", True)
+    assert all(use_cache is False for _, _, use_cache in google.calls[1:])
+
+
+def test_queries_are_scoped_to_their_owner(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One")]
+    query_id = _search(client, auth_headers).json()["id"]
+
+    client.post(
+        "/api/auth/register",
+        json={"username": "mallory", "email": "mallory@example.com", "password": "password123"},
+    )
+    token = client.post(
+        "/api/auth/login", data={"username": "mallory@example.com", "password": "password123"}
+    ).json()["access_token"]
+    other_headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get(f"/api/places/queries/{query_id}", headers=other_headers).status_code == 404
+    assert client.get(f"/api/places/queries/{query_id}/places", headers=other_headers).status_code == 404
+
+
+def test_etag_returns_304_until_places_change(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One")]
+    query_id = _search(client, auth_headers).json()["id"]
+    url = f"/api/places/queries/{query_id}"
+
+    response = client.get(url, headers=auth_headers)
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    google.details = {"p1": {"formatted_phone_number": "021 555 0101"}}
+    client.post(
+        "/api/places/refresh",
+        json={"search_query_id": query_id, "refresh_details": True},
+        headers=auth_headers,
+    )
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_etags_differ_between_query_and_places(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One")]
+    query_id = _search(client, auth_headers).json()["id"]
+    query_url = f"/api/places/queries/{query_id}"
+    places_url = f"{query_url}/places"
+
+    query_etag = client.get(query_url, headers=auth_headers).headers["etag"]
+    places_etag = client.get(places_url, headers=auth_headers).headers["etag"]
+    assert query_etag != places_etag
+
+    response = client.get(places_url, headers={**auth_headers, "If-None-Match": query_etag})
+    assert response.status_code == 200
+    response = client.get(places_url, headers={**auth_headers, "If-None-Match": places_etag})
+    assert response.status_code == 304
+
+
+def test_unknown_business_status_and_price_level_are_returned(client, auth_headers, google):
+    google.results = [text_search_result("p1", "One", business_status="SOMETHING_NEW")]
+    google.details = {"p1": {"business_status": "SOMETHING_NEW", "price_level": 7}}
+
+    place = _search(client, auth_headers, max_details=1).json()["places"][0]
+    assert (place["business_status"], place["price_level"]) == ("SOMETHING_NEW", 7)
@@ -0,0 +1,41 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import SPAStaticFiles
+
+
+@pytest.fixture
+def spa_client(tmp_path):
+    (tmp_path / "index.html").write_text("<html>spa</html>")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "app.js").write_text("console.log('app')")
+    spa = FastAPI()
+    spa.mount("/", SPAStaticFiles(directory=tmp_path, html=True), name="spa")
+    return TestClient(spa)
+
+
+@pytest.mark.parametrize("path", ["/", "/dashboard", "/queries/12", "/user/john.doe", "/apiary"])
+def test_client_routes_fall_back_to_index(spa_client, path):
+    response = spa_client.get(path)
+    assert response.status_code == 200
+    assert response.text == "<html>spa</html>"
+
+
+def test_existing_asset_is_served(spa_client):
+    response = spa_client.get("/assets/app.js")
+    assert response.status_code == 200
+    assert "console.log" in response.text
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/assets/missing.js", "/assets", "/favicon.ico", "/robots.txt", "/Logo.PNG", "/api/nope", "/health/x"],
+)
+def test_missing_files_and_api_paths_are_not_found(spa_client, path):
+    assert spa_client.get(path).status_code == 404
+
+
+def test_index_supports_conditional_requests(spa_client):
+    etag = spa_client.get("/").headers["etag"]
+    assert spa_client.get("/", headers={"If-None-Match": etag}).status_code == 304
@@ -1,5 +1,5 @@
 import { useState, useMemo, ChangeEvent, MouseEvent } from 'react';
-import { Place, RefreshRequest, SearchQuery } from '../services/api';
+import { OpeningHours, Place, RefreshRequest, SearchQuery } from '../services/api';
 
 interface PlacesTableProps {
   currentQuery: SearchQuery | null;
@@ -9,12 +9,6 @@ interface PlacesTableProps {
   loading: boolean;
 }
 
-interface OpeningHoursData {
-  weekday_text?: string[];
-  open_now?: boolean;
-  periods?: unknown[];
-}
-
 const PlacesTable = ({ currentQuery, places, onRefresh, queryId, loading }: PlacesTableProps) => {
   const [refreshTextSearch, setRefreshTextSearch] = useState<boolean>(false);
   const [refreshDetails, setRefreshDetails] = useState<boolean>(false);
@@ -116,45 +110,27 @@ const PlacesTable = ({ currentQuery, places, onRefresh, queryId, loading }: Plac
           ? `${normalized.slice(0, 2)}:${normalized.slice(2)}`
           : normalized;
       };
-      if (place.opening_hours) {
-        try {
-          const hours = JSON.parse(place.opening_hours);
-          if (hours.periods && Array.isArray(hours.periods)) {
-            hours.periods.forEach((period: any) => {
-              const openDay = period?.open?.day;
-              const dayKey = dayKeyMap[openDay as number];
-              if (!dayKey) return;
-              const openTime = formatTime(period?.open?.time);
-              const closeTime = formatTime(period?.close?.time);
-              if (openTime || closeTime) {
-                dailyHours[dayKey] = { open: openTime, close: closeTime, closed: 'false' };
-              }
-            });
-            Object.keys(dailyHours).forEach((day) => {
-              if (!dailyHours[day].open && !dailyHours[day].close) {
-                dailyHours[day].closed = 'true';
-              }
-            });
+      const hours = place.opening_hours;
+      if (hours?.periods && Array.isArray(hours.periods)) {
+        hours.periods.forEach((period: any) => {
+          const openDay = period?.open?.day;
+          const dayKey = dayKeyMap[openDay as number];
+          if (!dayKey) return;
+          const openTime = formatTime(period?.open?.time);
+          const closeTime = formatTime(period?.close?.time);
+          if (openTime || closeTime) {
+            dailyHours[dayKey] = { open: openTime, close: closeTime, closed: 'false' };
           }
-        } catch (e) {
-          // If parsing fails, leave daily hours empty
-        }
+        });
+        Object.keys(dailyHours).forEach((day) => {
+          if (!dailyHours[day].open && !dailyHours[day].close) {
+            dailyHours[day].closed = 'true';
+          }
+        });
       }
       
       // Format types for CSV
-      let types = '';
-      if (place.types) {
-        try {
-          const typesArray = JSON.parse(place.types);
-          if (Array.isArray(typesArray)) {
-            types = typesArray.join(', ');
-          } else {
-            types = place.types;
-          }
-        } catch (e) {
-          types = place.types;
-        }
-      }
+      const types = place.types ? place.types.join(', ') : '';
       
       // Format price level
       const priceLevel = place.price_level !== null && place.price_level !== undefined 
@@ -378,35 +354,17 @@ const PlacesTable = ({ currentQuery, places, onRefresh, queryId, loading }: Plac
           <tbody>
             {paginatedPlaces.map((place, index) => {
               const lineNumber = startIndex + index + 1;
-              // Parse opening hours if available
+              // Format opening hours if available
               let openingHoursDisplay = '-';
-              if (place.opening_hours) {
-                try {
-                  const hours: OpeningHoursData = JSON.parse(place.opening_hours);
-                  if (hours.weekday_text && Array.isArray(hours.weekday_text)) {
-                    openingHoursDisplay = hours.weekday_text.join('; ');
-                  } else if (hours.open_now !== undefined) {
-                    openingHoursDisplay = hours.open_now ? 'Open Now' : 'Closed Now';
-                  }
-                } catch (e) {
-                  openingHoursDisplay = place.opening_hours;
-                }
+              const hours = place.opening_hours;
+              if (hours?.weekday_text && Array.isArray(hours.weekday_text)) {
+                openingHoursDisplay = hours.weekday_text.join('; ');
+              } else if (hours?.open_now !== undefined) {
+                openingHoursDisplay = hours.open_now ? 'Open Now' : 'Closed Now';
               }
               
-              // Parse types if available
-              let typesDisplay = '-';
-              if (place.types) {
-                try {
-                  const types: unknown = JSON.parse(place.types);
-                  if (Array.isArray(types)) {
-                    typesDisplay = types.join(', ');
-                  } else {
-                    typesDisplay = place.types;
-                  }
-                } catch (e) {
-                  typesDisplay = place.types;
-                }
-              }
+              // Format types if available
+              const typesDisplay = place.types && place.types.length > 0 ? place.types.join(', ') : '-';
               
               // Format price level
               const priceLevelDisplay = place.price_level !== null && place.price_level !== undefined 
@@ -568,26 +526,8 @@ interface PlaceModalProps {
 }
 
 const PlaceModal = ({ place, onClose }: PlaceModalProps) => {
-  // Parse opening hours
-  let openingHoursData: OpeningHoursData | null = null;
-  if (place.opening_hours) {
-    try {
-      openingHoursData = JSON.parse(place.opening_hours) as OpeningHoursData;
-    } catch (e) {
-      openingHoursData = { weekday_text: [place.opening_hours] };
-    }
-  }
-  
-  // Parse types
-  let typesArray: string[] = [];
-  if (place.types) {
-    try {
-      const parsed = JSON.parse(place.types);
-      typesArray = Array.isArray(parsed) ? parsed : [place.types];
-    } catch (e) {
-      typesArray = [place.types];
-    }
-  }
+  const openingHoursData: OpeningHours | null = place.opening_hours ?? null;
+  const typesArray: string[] = place.types ?? [];
   
   // Format price level
   const priceLevel = place.price_level !== null && place.price_level !== undefined 
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { placesAPI, SearchQuery } from '../services/api';
+import { placesAPI, SearchQuery, SearchQuerySummary } from '../services/api';
 import { AxiosError } from 'axios';
 
 interface PreviousSearchesProps {
@@ -9,7 +9,7 @@ interface PreviousSearchesProps {
 }
 
 const PreviousSearches = ({ onSelectSearch, currentQueryId, refreshTrigger }: PreviousSearchesProps) => {
-  const [searches, setSearches] = useState<SearchQuery[]>([]);
+  const [searches, setSearches] = useState<SearchQuerySummary[]>([]);
   const [loading, setLoading] = useState<boolean>(true);
   const [error, setError] = useState<string>('');
 
@@ -91,7 +91,7 @@ const PreviousSearches = ({ onSelectSearch, currentQueryId, refreshTrigger }: Pr
                 <strong style={styles.searchText}>
                   {search.category} in {search.city}
                 </strong>
-                <span style={styles.badge}>{search.places?.length || 0} places</span>
+                <span style={styles.badge}>{search.place_count} places</span>
               </div>
               <div style={styles.searchMeta}>
                 <span style={styles.date}>Created: {formatDate(search.created_at)}</span>
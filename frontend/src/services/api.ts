@@ -31,6 +31,12 @@ export interface LoginData {
   password: string;
 }
 
+export interface OpeningHours {
+  weekday_text?: string[];
+  open_now?: boolean;
+  periods?: unknown[];
+}
+
 export interface Place {
   id: number;
   place_id: string;
@@ -45,10 +51,10 @@ export interface Place {
   phone_number?: string;
   website?: string;
   business_status?: string;
-  types?: string;
+  types?: string[] | null;
   formatted_address?: string;
   international_phone_number?: string;
-  opening_hours?: string;
+  opening_hours?: OpeningHours | null;
   price_level?: number;
   description?: string;
   photo_reference?: string;
@@ -75,6 +81,15 @@ export interface SearchQuery {
   places: Place[];
 }
 
+export interface SearchQuerySummary {
+  id: number;
+  city: string;
+  category: string;
+  created_at: string;
+  updated_at?: string;
+  place_count: number;
+}
+
 export interface SearchRequest {
   city: string;
   category: string;
@@ -137,7 +152,7 @@ export const authAPI = {
 
 export const placesAPI = {
   search: (data: SearchRequest) => api.post<SearchQuery>('/api/places/search', data),
-  getQueries: () => api.get<SearchQuery[]>('/api/places/queries'),
+  getQueries: () => api.get<SearchQuerySummary[]>('/api/places/queries'),
   getQuery: (id: number) => api.get<SearchQuery>(`/api/places/queries/${id}`),
   getPlaces: (queryId: number) => api.get<Place[]>(`/api/places/queries/${queryId}/places`),
   refresh: (data: RefreshRequest) => api.post<SearchQuery>('/api/places/refresh', data),